@@ -153,7 +153,11 @@ def get_polynomials() -> List[Tuple[int, str, bool, int, bool, int]]:
         polynomials += list(entry.values())
     return polynomials
 
+# Precomputed name -> position-within-width-group lookup so get_poly_index
+# is O(1) instead of a linear scan over every width group per call
+_POLY_INDEX: Dict[str, int] = {
+    name: i for grp in KOOPMAN_POLYNOMIALS.values() for i, name in enumerate(grp)
+}
+
 def get_poly_index(poly: str) -> int:
-    for grp in KOOPMAN_POLYNOMIALS.values():
-        if poly in grp.keys():
-            return list(grp.keys()).index(poly)
\ No newline at end of file
+    return _POLY_INDEX.get(poly)
\ No newline at end of file
@@ -1,7 +1,12 @@
 `timescale 1ps/1ps
 module simple_dp_ram # (
     parameter int DWIDTH = 64,
-    parameter int DEPTH = 512
+    parameter int DEPTH = 512,
+    //simulation-only backdoor preload: when INIT_FILE is non-empty the
+    //memory is loaded with $readmemh from "<INIT_FILE><INIT_INDEX>.hex"
+    //(or from INIT_FILE itself when INIT_INDEX < 0) at time zero
+    parameter INIT_FILE = "",
+    parameter int INIT_INDEX = -1
 ) (
     input logic clk,
     input logic [DWIDTH-1:0] wr_data,
@@ -13,6 +18,15 @@ module simple_dp_ram # (
 );
     logic [DWIDTH-1:0] mem_int[DEPTH-1:0];
 
+    initial begin
+        if (INIT_FILE != "") begin
+            if (INIT_INDEX >= 0)
+                $readmemh($sformatf("%s%0d.hex", INIT_FILE, INIT_INDEX), mem_int);
+            else
+                $readmemh(INIT_FILE, mem_int);
+        end
+    end
+
     always_ff @(posedge clk) begin
         if (wr_en) mem_int[wr_addr] <= wr_data;
     end
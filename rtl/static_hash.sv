@@ -3,7 +3,11 @@
 module static_hash #(
     parameter int CRC_WIDTH = 8,
     parameter int DATA_WIDTH = 32,
-    parameter int N_CRCS = 8
+    parameter int N_CRCS = 8,
+    //simulation-only: prefix of per-polynomial $readmemh hash table
+    //files ("<PRELOAD_FILE><i>.hex"); leave empty for synthesis and
+    //load the tables over AXI-Lite instead
+    parameter PRELOAD_FILE = ""
 ) (
     input logic clk,
     input logic rst,
@@ -50,7 +54,9 @@ module static_hash #(
     for (genvar i = 0; i < N_CRCS; i++) begin
         simple_dp_ram #(
             .DWIDTH(CRC_WIDTH+1),
-            .DEPTH(2**CRC_WIDTH)
+            .DEPTH(2**CRC_WIDTH),
+            .INIT_FILE(PRELOAD_FILE),
+            .INIT_INDEX(i)
         ) u_simple_dp_ram (
             .clk(clk),
             .wr_data(mem_data),
@@ -4,7 +4,6 @@ import argparse
 from pathlib import Path
 from typing import List
 import random
-import itertools
 
 import cocotb
 from cocotb.clock import Clock
@@ -20,7 +19,21 @@ from static_hash import StaticHasher
 #module name
 TOP_MODULE = "tb"
 
-mem_initialized = False
+#input file cache: the testbench and the hasher model share one read
+_lines_cache = {}
+
+def pause_gen(pause_rate: float):
+    """Infinite lazy pause stream: O(1) memory, consumed on demand"""
+    rand = random.random
+    while True:
+        yield rand() < pause_rate
+
+def read_lines(input_file) -> List[str]:
+    key = str(input_file)
+    if key not in _lines_cache:
+        with open(key, 'r', encoding='ascii') as f:
+            _lines_cache[key] = f.read().splitlines()
+    return _lines_cache[key]
 
 class AXISMonitor:
     def __init__(self, axis_mon: AxiStreamMonitor):
@@ -91,9 +104,9 @@ async def unit_test(dut, traffic_rate, backpressure_rate):
     CRC_WIDTH = dut.CRC_WIDTH.value
     input_file = dut.IN_FILE.value.decode('utf-8')
     max_ids = 2**CRC_WIDTH
+    lines = read_lines(input_file)
     static_hash = StaticHasher(max_ids)
-    static_hash.process_file(input_file)
-    mem = static_hash.hash_table_bin
+    static_hash.process_lines(lines)
     hash_table = static_hash.hash_table
 
     def make_check_func(hash_table):
@@ -106,6 +119,10 @@ async def unit_test(dut, traffic_rate, backpressure_rate):
 
     check_func = make_check_func(hash_table)
 
+    #pre-encode all stimulus frames so the send loop does no string work
+    #while competing with the simulator for CPU time
+    frames = [AxiStreamFrame(line.strip().encode('ascii')) for line in lines]
+
     cocotb.start_soon(Clock(dut.clk, 2, units="ns").start())
     axis_checker = AXISChecker(dut, "sparse_axis", "uuid_axis", dut.clk, dut.rst, check_func)
     axis_checker.start()
@@ -114,8 +131,8 @@ async def unit_test(dut, traffic_rate, backpressure_rate):
     axis_sink = AxiStreamSink(AxiStreamBus.from_prefix(dut, "uuid_axis"), dut.clk, dut.rst)
     axil_source = AxiLiteMaster(AxiLiteBus.from_prefix(dut, "cfg_axil"), dut.clk, dut.rst)
 
-    axis_source.set_pause_generator(itertools.cycle([random.random() >= traffic_rate for _ in range(10000000)]))
-    axis_sink.set_pause_generator(itertools.cycle([random.random() < backpressure_rate for _ in range(10000000)]))
+    axis_source.set_pause_generator(pause_gen(1 - traffic_rate))
+    axis_sink.set_pause_generator(pause_gen(backpressure_rate))
 
     dut._log.info("Initialize and reset model")
 
@@ -128,20 +145,11 @@ async def unit_test(dut, traffic_rate, backpressure_rate):
     #out of reset
     dut._log.info("Test Started")
 
-    dut._log.info("Write static hash tables in to internal memories")
-    global mem_initialized
-    if not mem_initialized:
-        mem_initialized = True
-        for i in range(8*max_ids):
-            content_to_write = mem[i*4:(i+1)*4]
-            await axil_source.write(i*4, content_to_write)
+    #hash table RAMs are backdoor-preloaded with $readmemh at time zero
+    #(see PRELOAD_FILE in tb.sv), no AXI-Lite initialization needed
     dut._log.info("Start symbol->uuid mapping test")
-    lines = []
-    with open(input_file, 'r', encoding='ascii') as f:
-        lines = f.readlines()
-    for line in lines:
-        text_bytes = line.strip().encode('ascii')
-        await axis_source.send(AxiStreamFrame(text_bytes))
+    for frame in frames:
+        await axis_source.send(frame)
     #now = get_sim_time(units="us")
     while True:
         await RisingEdge(dut.clk)
@@ -163,18 +171,23 @@ def test_runner():
     if not input_file or not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
-    lines = []
-    with open(input_file, 'r', encoding='ascii') as f:
-        lines = f.readlines()
-    lines = [line.strip() for line in lines]
+    lines = [line.strip() for line in read_lines(input_file)]
     CRC_WIDTH = (len(lines)-1).bit_length()
     DATA_WIDTH = max(map(len, lines), default=0)*8
     IN_FILE = f'"{input_file}"'
 
+    #generate the hash table once up front and dump the per-polynomial
+    #$readmemh files used to backdoor-preload the RAMs at time zero
+    static_hash = StaticHasher(2**CRC_WIDTH)
+    static_hash.process_lines(lines)
+    preload_prefix = sim_path / "hash_table"
+    static_hash.dump_hex_tables(str(preload_prefix))
+
     parameters = {
         "DATA_WIDTH": DATA_WIDTH,
         "CRC_WIDTH": CRC_WIDTH,
-        "IN_FILE": IN_FILE
+        "IN_FILE": IN_FILE,
+        "PRELOAD_FILE": f'"{preload_prefix}"'
     }
 
     runner = get_runner(sim)
@@ -13,7 +13,9 @@ Key Features:
 - Automatic CRC width selection (even-bit widths only)
 - Multi-layer conflict resolution strategy
 - Support for ASCII text and hexadecimal input formats
-- Efficient table-driven CRC calculation using pycrc library
+- Fast slice-by-16 table-driven CRC kernels compiled with Numba, with
+  C-accelerated crcmod scalar calculators (pycrc is kept as a fallback
+  for reflected polynomial configurations)
 
 CRC Polynomials Used:
 - 8-bit CRCs for up to 256 IDs
@@ -29,15 +31,189 @@ All polynomials are based on Philip Koopman's extensive research into
 optimal CRC polynomials for error detection.
 """
 
+import crcmod
 import pycrc.algorithms as crc_algorithms
 import sys
 import argparse
 import math
-from collections import defaultdict
+from collections import defaultdict, Counter
 from typing import Dict, List, Tuple
 
+import numpy as np
+from numba import njit, prange
+
 # Import CRC polynomials from separate module
-from crc_polynomials import KOOPMAN_POLYNOMIALS, get_poly_index
+from crc_polynomials import KOOPMAN_POLYNOMIALS
+
+def build_slice16_table(poly: int, width: int) -> np.ndarray:
+    """
+    Build a 16x256 slice-by-16 lookup table for a non-reflected CRC.
+
+    The CRC register is kept left-aligned in 32 bits so the same kernel
+    works for any width <= 32; callers shift the result right by
+    (32 - width) to recover the CRC value.
+
+    Args:
+        poly: CRC polynomial (implicit top bit may be included)
+        width: CRC width in bits
+    """
+    shift = 32 - width
+    poly_aligned = (poly << shift) & 0xffffffff
+    table = np.zeros((16, 256), dtype=np.uint32)
+    # Plane 0: plain byte-at-a-time table, left-aligned
+    for byte in range(256):
+        reg = byte << 24
+        for _ in range(8):
+            if reg & 0x80000000:
+                reg = ((reg << 1) & 0xffffffff) ^ poly_aligned
+            else:
+                reg = (reg << 1) & 0xffffffff
+        table[0, byte] = reg
+    # Plane k: CRC of the byte followed by k zero bytes
+    for k in range(1, 16):
+        for byte in range(256):
+            prev = int(table[k - 1, byte])
+            table[k, byte] = ((prev << 8) & 0xffffffff) ^ int(table[0, prev >> 24])
+    return table
+
+@njit(cache=True)
+def crc_slice16(buf, table, shift):
+    """
+    Slice-by-16 CRC over a uint8 buffer using a 16x256 left-aligned table.
+
+    Consumes 16 bytes per iteration (16 independent table lookups that
+    LLVM can schedule in parallel), then finishes byte-at-a-time.
+    Returns the CRC shifted back down to its natural width.
+    """
+    reg = np.uint64(0)
+    n = buf.shape[0]
+    i = 0
+    while n - i >= 16:
+        prev = reg
+        reg = np.uint64(0)
+        # First 4 bytes are XORed with the current register state
+        for k in range(4):
+            idx = np.uint64(buf[i + k]) ^ ((prev >> np.uint64(24 - 8 * k)) & np.uint64(0xff))
+            reg ^= np.uint64(table[15 - k, idx])
+        # Remaining 12 bytes only depend on the input data
+        for k in range(4, 16):
+            reg ^= np.uint64(table[15 - k, buf[i + k]])
+        i += 16
+    while i < n:
+        idx = ((reg >> np.uint64(24)) ^ np.uint64(buf[i])) & np.uint64(0xff)
+        reg = ((reg << np.uint64(8)) & np.uint64(0xffffffff)) ^ np.uint64(table[0, idx])
+        i += 1
+    return reg >> np.uint64(shift)
+
+def make_crc_kernel(table: np.ndarray, shift: int):
+    """
+    Partially evaluate crc_slice16 for a single polynomial.
+
+    The lookup table and final shift are captured by the closure, so
+    Numba freezes them as compile-time constants and LLVM can hoist the
+    table base address and constant-fold the shift. Kernels are built
+    lazily (first use per polynomial) to keep JIT cost off unused paths.
+    """
+    shift = np.uint64(shift)
+
+    @njit
+    def kernel(buf):
+        reg = np.uint64(0)
+        n = buf.shape[0]
+        i = 0
+        while n - i >= 16:
+            prev = reg
+            reg = np.uint64(0)
+            for k in range(4):
+                idx = np.uint64(buf[i + k]) ^ ((prev >> np.uint64(24 - 8 * k)) & np.uint64(0xff))
+                reg ^= np.uint64(table[15 - k, idx])
+            for k in range(4, 16):
+                reg ^= np.uint64(table[15 - k, buf[i + k]])
+            i += 16
+        while i < n:
+            idx = ((reg >> np.uint64(24)) ^ np.uint64(buf[i])) & np.uint64(0xff)
+            reg = ((reg << np.uint64(8)) & np.uint64(0xffffffff)) ^ np.uint64(table[0, idx])
+            i += 1
+        return reg >> shift
+
+    return kernel
+
+@njit(cache=True, parallel=True, nogil=True)
+def compute_all_crcs(buf2d, lengths, tables, shift):
+    """
+    Compute the CRC of every string under every polynomial.
+
+    The (string, polynomial) CRCs are all independent; strings are
+    spread across cores with prange (better load balance than splitting
+    on the 8 polynomial columns).
+
+    Args:
+        buf2d: (num_strings, line_size) uint8 array of zero-padded strings
+        lengths: per-string byte counts (rows are hashed up to their length)
+        tables: (num_polys, 16, 256) uint32 stack of slice-by-16 tables
+        shift: 32 - crc_width
+
+    Returns:
+        (num_strings, num_polys) uint32 matrix of CRC values
+    """
+    num_strings = buf2d.shape[0]
+    num_polys = tables.shape[0]
+    out = np.empty((num_strings, num_polys), dtype=np.uint32)
+    for i in prange(num_strings):
+        row = buf2d[i, :lengths[i]]
+        for p in range(num_polys):
+            out[i, p] = crc_slice16(row, tables[p], shift)
+    return out
+
+@njit(cache=True, parallel=True, nogil=True)
+def compute_all_crcs_swar(words, lengths, tables, shift):
+    """
+    Batch CRC for strings of at most 8 bytes, one uint64 per string.
+
+    Each padded string is loaded as a single little-endian uint64, so
+    the per-polynomial inner loop shifts bytes out of a register instead
+    of indexing the byte buffer; with at most 8 rounds per string the
+    whole CRC stays in registers.
+
+    Args:
+        words: (num_strings,) uint64 array of little-endian packed strings
+        lengths: per-string byte counts (<= 8)
+        tables: (num_polys, 16, 256) uint32 stack of slice-by-16 tables
+        shift: 32 - crc_width
+
+    Returns:
+        (num_strings, num_polys) uint32 matrix of CRC values
+    """
+    num_strings = words.shape[0]
+    num_polys = tables.shape[0]
+    out = np.empty((num_strings, num_polys), dtype=np.uint32)
+    for i in prange(num_strings):
+        word0 = words[i]
+        n = lengths[i]
+        for p in range(num_polys):
+            table = tables[p]
+            reg = np.uint64(0)
+            word = word0
+            for _ in range(n):
+                idx = ((reg >> np.uint64(24)) ^ word) & np.uint64(0xff)
+                reg = ((reg << np.uint64(8)) & np.uint64(0xffffffff)) ^ np.uint64(table[0, idx])
+                word >>= np.uint64(8)
+            out[i, p] = np.uint32(reg >> np.uint64(shift))
+    return out
+
+def pack_strings(strings: List[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack byte strings into one contiguous zero-padded uint8 buffer.
+
+    Returns (buf2d, lengths); buf2d has at least 8 columns so rows can
+    be reinterpreted as uint64 words by the SWAR kernel.
+    """
+    lengths = np.array([len(s) for s in strings], dtype=np.int64)
+    line_size = int(lengths.max()) if len(strings) else 0
+    buf2d = np.zeros((len(strings), max(line_size, 8)), dtype=np.uint8)
+    for i, string in enumerate(strings):
+        buf2d[i, :len(string)] = np.frombuffer(string, dtype=np.uint8)
+    return buf2d, lengths
 
 class StaticHasher:
     def __init__(self, max_ids: int = 32768):
@@ -63,133 +239,212 @@ class StaticHasher:
             self.crc_width = min_available_width
 
         self.id_mask = (1 << required_bits) - 1
+        # Masking is a no-op when the ID range fills the whole CRC width
+        self.need_mask = self.id_mask != (1 << self.crc_width) - 1
         self.polynomials = KOOPMAN_POLYNOMIALS[self.crc_width]
 
         # Initialize CRC calculators
         self.crc_calculators = {}
+        # Slice-by-16 lookup tables for the Numba fast path (one 16x256
+        # plane per polynomial); reflected/preset polynomials fall back
+        # to pycrc, but every entry in the database is non-reflected.
+        self.crc_tables = {}
+        self.crc_xor_out = {}
+        # Lazily-built per-polynomial specialized kernels (see make_crc_kernel)
+        self.crc_kernels = {}
         for name, (poly, _, reflect_in, xor_in, reflect_out, xor_out) in self.polynomials.items():
-            # Create CRC calculator using correct pycrc API
-            crc_calc = crc_algorithms.Crc(
-                width=self.crc_width,
-                poly=poly,
-                reflect_in=reflect_in,
-                xor_in=xor_in,
-                reflect_out=reflect_out,
-                xor_out=xor_out
-            )
-            self.crc_calculators[name] = crc_calc
+            if not reflect_in and not reflect_out and xor_in == 0:
+                # C-accelerated scalar calculator: crcmod only supports
+                # byte-multiple widths, so run the polynomial left-aligned
+                # in 32 bits and shift the result back down (same register
+                # layout as the slice-by-16 tables)
+                shift = 32 - self.crc_width
+                poly_aligned = (1 << 32) | ((poly << shift) & 0xffffffff)
+                crc_fun = crcmod.mkCrcFun(poly_aligned, initCrc=0, rev=False,
+                                          xorOut=(xor_out << shift) & 0xffffffff)
+                self.crc_calculators[name] = \
+                    (lambda text, f=crc_fun, s=shift: f(text) >> s)
+                self.crc_tables[name] = build_slice16_table(poly, self.crc_width)
+                self.crc_xor_out[name] = xor_out
+            else:
+                # pycrc fallback for reflected configurations
+                crc_calc = crc_algorithms.Crc(
+                    width=self.crc_width,
+                    poly=poly,
+                    reflect_in=reflect_in,
+                    xor_in=xor_in,
+                    reflect_out=reflect_out,
+                    xor_out=xor_out
+                )
+                self.crc_calculators[name] = crc_calc.table_driven
 
         if not self.crc_calculators:
             raise ValueError(f"No CRC-{self.crc_width} calculators could be created")
         #hash table in binary format
         self.id_bytes = 4 #4 bytes per entry
-        self.hash_table_bin = bytearray(self.id_bytes*8*self.max_ids)
+        # One little-endian uint32 entry per (polynomial, hash) address
+        self.hash_table_bin = np.zeros(8*self.max_ids, dtype='<u4')
         #human readable hash table
         self.hash_table = {}
 
     def calculate_crc(self, text: bytes, crc_name: str) -> int:
         """Calculate CRC for given text using specified CRC function"""
-        crc_calc = self.crc_calculators[crc_name]
-        # Use table_driven method for better performance
-        crc_value = crc_calc.table_driven(text)
+        table = self.crc_tables.get(crc_name)
+        if table is not None:
+            # Numba slice-by-16 fast path, specialized per polynomial
+            kernel = self.crc_kernels.get(crc_name)
+            if kernel is None:
+                kernel = make_crc_kernel(table, 32 - self.crc_width)
+                self.crc_kernels[crc_name] = kernel
+            buf = np.frombuffer(text, dtype=np.uint8)
+            crc_value = int(kernel(buf)) ^ self.crc_xor_out[crc_name]
+        else:
+            # scalar calculator (crcmod, or pycrc for reflected polynomials)
+            crc_value = self.crc_calculators[crc_name](text)
         # Mask to the configured ID range
-        return crc_value & self.id_mask
+        return crc_value & self.id_mask if self.need_mask else crc_value
 
     def find_conflicts(self, strings: List[bytes], crc_name: str) -> Dict[int, List[bytes]]:
         """Find conflicts for a given CRC function"""
-        hash_to_strings = defaultdict(list)
+        hash_values = [self.calculate_crc(string, crc_name) for string in strings]
+        counts = Counter(hash_values)
 
-        for string in strings:
-            hash_value = self.calculate_crc(string, crc_name)
-            hash_to_strings[hash_value].append(string)
+        # Collect only conflicting entries (hash values with multiple strings)
+        conflicts = defaultdict(list)
+        for string, hash_value in zip(strings, hash_values):
+            if counts[hash_value] > 1:
+                conflicts[hash_value].append(string)
+        return dict(conflicts)
 
-        # Return only conflicting entries (hash values with multiple strings)
-        conflicts = {k: v for k, v in hash_to_strings.items() if len(v) > 1}
-        return conflicts
+    def compute_crc_matrix(self, buf2d: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """
+        Compute CRCs of all packed strings under all polynomials in one batch.
 
-    def assign_hash_functions(self, strings: List[bytes]) -> Dict[bytes, Tuple[str, int]]:
+        Takes the (buf2d, lengths) pair produced by pack_strings; columns
+        follow the insertion order of self.crc_calculators. Returns a
+        (num_strings, num_polys) uint32 matrix already masked to the
+        configured ID range.
+        """
+        max_length = int(lengths.max()) if len(lengths) else 0
+        if len(self.crc_tables) == len(self.crc_calculators):
+            # All polynomials have slice-by-16 tables: single batch kernel
+            tables = np.stack([self.crc_tables[name] for name in self.crc_calculators])
+            xor_outs = np.array([self.crc_xor_out[name] for name in self.crc_calculators],
+                                dtype=np.uint32)
+            if max_length <= 8:
+                # Common case for symbol-style inputs: whole string in a register
+                words = buf2d[:, :8].copy().view('<u8').ravel()
+                crcs = compute_all_crcs_swar(words, lengths, tables, 32 - self.crc_width)
+            else:
+                crcs = compute_all_crcs(buf2d, lengths, tables, 32 - self.crc_width)
+            crcs ^= xor_outs[np.newaxis, :]
+        else:
+            # Mixed configuration: fall back to per-string calculation
+            crcs = np.empty((buf2d.shape[0], len(self.crc_calculators)), dtype=np.uint32)
+            for p, crc_name in enumerate(self.crc_calculators):
+                for i in range(buf2d.shape[0]):
+                    crcs[i, p] = self.calculate_crc(buf2d[i, :lengths[i]].tobytes(), crc_name)
+        return crcs & np.uint32(self.id_mask) if self.need_mask else crcs
+
+    def assign_hash_functions(self, crcs: np.ndarray) -> Dict[int, Tuple[str, int]]:
         """
         Assign CRC functions to strings to minimize conflicts.
-        Returns dict mapping string -> (crc_function_name, unique_id)
+        Works purely on string indices (rows of the CRC matrix from
+        compute_crc_matrix), so no string bytes are ever hashed.
+        Returns dict mapping string index -> (poly_index, unique_id),
+        where poly_index is the polynomial's position in
+        self.crc_calculators (and its column in the CRC matrix).
         """
         result = {}
-        remaining_strings = strings.copy()
+        # Strings still waiting for a conflict-free CRC layer, tracked as
+        # a boolean mask over string indices (no list rebuilds, no
+        # re-hashing of the string bytes between layers)
+        active = np.ones(crcs.shape[0], dtype=bool)
         next_unique_id = 0  # Counter for unique IDs starting from 0
-        for crc_name in self.crc_calculators:
-            # Get conflicts for the selected CRC function
-            conflicts = self.find_conflicts(remaining_strings, crc_name)
-
-            # Assign only non-conflicting strings to this CRC function
-            newly_assigned = set()
-            conflicted_strings = set()
-            # Collect all strings that have conflicts
-            for _, conflicting_strings in conflicts.items():
-                for string in conflicting_strings:
-                    conflicted_strings.add(string)
-
-            # Assign only strings that don't have any conflicts
-            for string in remaining_strings:
-                if string not in conflicted_strings:
-                    result[string] = (crc_name, next_unique_id)
-                    next_unique_id += 1
-                    newly_assigned.add(string)
-
-            # Remove assigned strings from remaining list
-            remaining_strings = [s for s in remaining_strings if s not in newly_assigned]
-            if not remaining_strings:
+        for p, _ in enumerate(self.crc_calculators):
+            # Find conflicts for the selected CRC function: a string is
+            # assignable iff its CRC value appears exactly once. bincount
+            # over the bounded CRC range is cheaper than sorting (np.unique)
+            rows = np.flatnonzero(active)
+            col = crcs[rows, p]
+            counts = np.bincount(col, minlength=self.id_mask + 1)
+            assignable = rows[counts[col] == 1]
+
+            # Assign only non-conflicting strings to this CRC function,
+            # carrying the polynomial's positional index (insertion order
+            # matches the width group in KOOPMAN_POLYNOMIALS)
+            for i in assignable:
+                result[int(i)] = (p, next_unique_id)
+                next_unique_id += 1
+            active[assignable] = False
+            if not active.any():
                 break
-        if len(remaining_strings) != 0:
-            raise ValueError(f"Could not resolve all conflicts, {len(remaining_strings)} strings remain unassigned")
+        if active.any():
+            raise ValueError(f"Could not resolve all conflicts, {int(active.sum())} strings remain unassigned")
         return result
 
+    def process_lines(self, lines: List[str], format: str = 'ascii'):
+        """Process input lines (one string per line) and generate results"""
+        # Clean and validate strings
+        strings = []
+        for i, line in enumerate(lines):
+            line = line.strip()
+            if format == 'ascii':
+                if len(line) > 32:
+                    raise ValueError(f"Line {i+1} exceeds 32 bytes: {line}")
+                if line:  # Skip empty lines
+                    strings.append(line)
+            elif format == 'hex':
+                if line:  # Skip empty lines
+                    # Convert hex string to bytes
+                    hex_bytes = bytes.fromhex(line)
+                    if len(hex_bytes) > 32:
+                        raise ValueError(f"Line {i+1} exceeds 32 bytes: {line}")
+                    strings.append(hex_bytes)
+
+        if len(strings) > self.max_ids:
+            raise ValueError(f"Input contains too many strings (>{self.max_ids})")
+        # Pack everything into one contiguous zero-padded buffer (no
+        # per-string bignum round trips); ASCII strings are hashed over
+        # the full padded line, hex strings over their actual length
+        encoded = [s.encode('ascii') for s in strings] if format == 'ascii' else strings
+        line_size = max(map(len, encoded), default=0)
+        buf2d, lengths = pack_strings(encoded)
+        if format == 'ascii':
+            # ASCII strings are hashed over the full zero-padded line
+            lengths[:] = line_size
+        # Assign hash functions, sharing one CRC matrix with the
+        # table-write pass below (no per-string recomputation); the
+        # assignment works on string indices, no bytes keys to hash
+        crcs = self.compute_crc_matrix(buf2d, lengths)
+        assignments = self.assign_hash_functions(crcs)
+
+        # Write results
+        # Each ID entry is 4 bytes (max 30-bit ID + 1 bit validity < 32-bit);
+        # gather the entries into arrays and scatter them in one shot
+        poly_idxs = np.empty(len(assignments), dtype=np.int64)
+        hash_vals = np.empty(len(assignments), dtype=np.int64)
+        unique_ids = np.empty(len(assignments), dtype=np.uint32)
+        for i in range(len(strings)):
+            poly_idx, unique_id = assignments[i]
+            poly_idxs[i] = poly_idx
+            hash_vals[i] = crcs[i, poly_idx]
+            unique_ids[i] = unique_id
+        addrs = (poly_idxs << self.crc_width) | hash_vals
+        contents = unique_ids | np.uint32(1 << self.crc_width)
+        self.hash_table_bin[addrs] = contents
+        # assignments are indexed by input order, pair them back up with
+        # the original strings
+        for i, string in enumerate(strings):
+            self.hash_table[string] = assignments[i][1]
+
     def process_file(self, input_file: str, format: str = 'ascii'):
         """Process input file and generate results"""
         try:
             # Read input file
-            lines = None
             with open(input_file, 'r', encoding='ascii') as f:
                 lines = f.readlines()
-
-            # Clean and validate strings
-            strings = []
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if format == 'ascii':
-                    if len(line) > 32:
-                        raise ValueError(f"Line {i+1} exceeds 32 bytes: {line}")
-                    if line:  # Skip empty lines
-                        strings.append(line)
-                elif format == 'hex':
-                    if line:  # Skip empty lines
-                        # Convert hex string to bytes
-                        hex_bytes = bytes.fromhex(line)
-                        if len(hex_bytes) > 32:
-                            raise ValueError(f"Line {i+1} exceeds 32 bytes: {line}")
-                        strings.append(hex_bytes)
-
-            if len(strings) > self.max_ids:
-                raise ValueError(f"Input file '{input_file}' contains too many strings (>{self.max_ids})")
-            hex_strings = strings
-            line_size = max(map(len, strings), default=0)
-            if format == 'ascii':
-                hex_strings = [int.from_bytes(s.encode("ascii"), 'little').to_bytes(line_size,'little') for s in strings]
-            # Assign hash functions
-            assignments = self.assign_hash_functions(hex_strings)
-
-            # Write results
-            # Set each ID entry to 4 bytes (max 30-bit ID + 1 bit validity < 32-bit)
-            id_bytes = 4
-
-            for string, (crc_func, unique_id) in assignments.items():
-                poly_idx = get_poly_index(crc_func)
-                hash_val = self.calculate_crc(string, crc_func)
-                addr = (poly_idx << self.crc_width) | hash_val
-                content = unique_id | (1 << self.crc_width)
-                self.hash_table_bin[addr*id_bytes:(addr+1)*id_bytes] = content.to_bytes(id_bytes, 'little')
-            for string in strings:
-                unique_id = assignments[int.from_bytes(string.encode("ascii"), 'little').to_bytes(line_size,'little') if format == 'ascii' else string][1]
-                self.hash_table[string] = unique_id
-
+            self.process_lines(lines, format)
         except FileNotFoundError:
             print(f"Error: Input file '{input_file}' not found")
             sys.exit(1)
@@ -200,8 +455,20 @@ class StaticHasher:
             print(f"Error processing file: {e}")
             sys.exit(1)
     def dump_binary_table(self, output_file: str = "result.bin"):
-        with open(output_file, 'wb') as f:
-            f.write(self.hash_table_bin)
+        # Little-endian uint32 array: tofile writes the buffer directly,
+        # no intermediate bytes copy
+        self.hash_table_bin.tofile(output_file)
+    def dump_hex_tables(self, prefix: str = "hash_table"):
+        """
+        Write one $readmemh-format file per polynomial ("<prefix><i>.hex")
+        so simulation can backdoor-preload the hash table RAMs instead of
+        loading them over AXI-Lite.
+        """
+        planes = self.hash_table_bin.reshape(8, self.max_ids)
+        for i in range(8):
+            with open(f"{prefix}{i}.hex", 'w', encoding='ascii') as f:
+                f.write('\n'.join(format(entry, 'x') for entry in planes[i]))
+                f.write('\n')
     def dump_readable_table(self, output_file: str = "result.txt"):
         with open(output_file, 'w', encoding='ascii') as f:
             for string, unique_id in self.hash_table.items():
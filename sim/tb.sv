@@ -2,6 +2,7 @@
 
 module tb #(
     parameter string IN_FILE = "input.txt",
+    parameter string PRELOAD_FILE = "",
     parameter int CRC_WIDTH = 8,
     parameter int DATA_WIDTH = 32
 ) (
@@ -41,7 +42,8 @@ module tb #(
 
     static_hash # (
         .CRC_WIDTH(CRC_WIDTH),
-        .DATA_WIDTH(DATA_WIDTH)
+        .DATA_WIDTH(DATA_WIDTH),
+        .PRELOAD_FILE(PRELOAD_FILE)
     ) u_static_hash (
         .*,
         .sparse_axis_tdata(sparse_axis_data_tmp),
@@ -9,12 +9,134 @@ This script generates realistic NYSE-style stock symbols following common patter
 - Includes common patterns like tech companies, banks, utilities, etc.
 """
 
-import random
 import string
+import os
 import sys
 import argparse
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+import numpy as np
+from numba import njit
+
+# Module-level alphabet binding: one attribute lookup at import instead of
+# one per reference
+_UP = string.ascii_uppercase
+
+# All 676 two-letter uppercase combinations: one RNG index draw yields two
+# letters at once, halving RNG consumption on the letter-heavy branches
+PAIRS = [a + b for a in _UP for b in _UP]
+
+def _encode(symbol):
+    """Pack a 1-5 letter symbol into one base-27 integer (A=1 .. Z=26)"""
+    code = 0
+    for ch in symbol:
+        code = code * 27 + (ord(ch) - 64)
+    return code
+
+def _decode(code):
+    """Inverse of _encode: unpack a base-27 code back to a string"""
+    chars = []
+    while code:
+        code, c = divmod(code, 27)
+        chars.append(_UP[c - 1])
+    return ''.join(reversed(chars))
+
+@njit(cache=True)
+def _dedup_insert(seen_mask, accepted, n_accepted, codes):
+    """Mark codes in the direct-indexed seen bitmap, appending previously
+    unseen ones to accepted; returns the new count"""
+    limit = accepted.shape[0]
+    n = n_accepted
+    for k in range(codes.shape[0]):
+        if n >= limit:
+            break
+        code = codes[k]
+        if not seen_mask[code]:
+            seen_mask[code] = True
+            accepted[n] = code
+            n += 1
+    return n
+
+@njit(cache=True)
+def _synth_batch(lengths, strategies, letters, cons_picks, industry_pick,
+                 abbrev_pick, industry_len, industry_prefix, abbrev_prefix,
+                 cons_codes, is_vowel):
+    """Pack one batch of candidates into base-27 codes (see _encode)"""
+    n = lengths.shape[0]
+    out = np.empty(n, dtype=np.uint32)
+    for j in range(n):
+        symbol_length = lengths[j]
+        strategy = strategies[j]
+
+        if strategy == 0:  # industry
+            # Pre-encoded pattern prefix plus random letters as needed
+            bi = industry_pick[j]
+            base_len = industry_len[bi]
+            code = industry_prefix[bi, min(symbol_length, base_len) - 1]
+            for i in range(symbol_length - base_len):
+                code = code * 27 + letters[j, i]
+
+        elif strategy == 1:  # company_style
+            if symbol_length <= 2:
+                # Initials style
+                code = letters[j, 0]
+                for i in range(1, symbol_length):
+                    code = code * 27 + letters[j, i]
+            else:
+                # Consonant-heavy patterns (more realistic)
+                code = 0
+                prev = 0
+                for i in range(symbol_length):
+                    if i == 0 or is_vowel[prev]:
+                        # Start with consonant or follow vowel with consonant
+                        prev = cons_codes[cons_picks[j, i]]
+                    else:
+                        # Mix consonants and vowels
+                        prev = letters[j, i]
+                    code = code * 27 + prev
+
+        elif strategy == 2:  # abbreviation
+            if symbol_length >= 3:
+                # Pre-encoded abbreviation prefix plus one random letter
+                code = abbrev_prefix[abbrev_pick[j], min(symbol_length - 1, 3) - 2] * 27 + letters[j, 5]
+            else:
+                code = letters[j, 0]
+                for i in range(1, symbol_length):
+                    code = code * 27 + letters[j, i]
+
+        else:  # random
+            code = letters[j, 0]
+            for i in range(1, symbol_length):
+                code = code * 27 + letters[j, i]
+
+        out[j] = code
+    return out
+
+def _worker_candidates(child_rng, n, tables):
+    """Draw and pack n candidate codes on one spawned RNG stream"""
+    (length_weights, cons_codes, is_vowel, industry_len, industry_prefix,
+     abbrev_prefix) = tables
+    lengths = child_rng.choice(5, size=n, p=length_weights) + 1
+    strategies = child_rng.integers(0, 4, size=n)
+    # Three pair-table picks give six uppercase letters per candidate;
+    # a parallel consonant row feeds the company_style branch
+    pair_idx = child_rng.integers(0, len(PAIRS), size=(n, 3))
+    cons_picks = child_rng.integers(0, cons_codes.shape[0], size=(n, 5))
+    industry_idx = child_rng.integers(0, industry_len.shape[0], size=n)
+    abbrev_idx = child_rng.integers(0, abbrev_prefix.shape[0], size=n)
+
+    # unpack the pair indices into six letter codes per candidate
+    letters = np.empty((n, 6), dtype=np.int64)
+    letters[:, 0::2] = pair_idx // 26 + 1
+    letters[:, 1::2] = pair_idx % 26 + 1
+
+    return _synth_batch(lengths, strategies, letters, cons_picks,
+                        industry_idx, abbrev_idx, industry_len,
+                        industry_prefix, abbrev_prefix, cons_codes, is_vowel)
+
 def generate_symbols(count=65536, seed=42):
     """
     Generate count unique NYSE-style stock symbols
@@ -23,9 +145,6 @@ def generate_symbols(count=65536, seed=42):
         count: Number of symbols to generate
         seed: Random seed for reproducible results
     """
-    random.seed(seed)
-    symbols = set()
-
     # Common NYSE symbol patterns and prefixes
     tech_prefixes = ['AAPL', 'GOOGL', 'MSFT', 'META', 'NFLX', 'NVDA', 'TSLA', 'AMD', 'INTC', 'ORCL']
     bank_prefixes = ['JPM', 'BAC', 'WFC', 'C', 'GS', 'MS', 'USB', 'PNC', 'TFC', 'COF']
@@ -53,102 +172,88 @@ def generate_symbols(count=65536, seed=42):
     print(f"Generating {count} NYSE-style stock symbols...")
 
     # Method 1: Add some real-looking symbols based on patterns
+    # The working set holds packed base-27 codes; strings are materialized
+    # only once at the very end
+    seen = set()
     real_patterns = tech_prefixes + bank_prefixes + utility_prefixes
     for pattern in real_patterns:
-        if len(symbols) >= count:
+        if len(seen) >= count:
             break
         for suffix in suffixes:
             symbol = pattern + suffix
             if len(symbol) <= 5 and symbol:  # NYSE symbols are max 5 characters
-                symbols.add(symbol)
-                if len(symbols) >= count:
+                seen.add(_encode(symbol))
+                if len(seen) >= count:
                     break
 
     # Method 2: Generate industry-based symbols
     attempts = 0
     max_attempts = count * 20
 
-    while len(symbols) < count and attempts < max_attempts:
-        attempts += 1
-
-        # Choose symbol length (weighted towards shorter symbols like real NYSE)
-        length_weights = [5, 25, 35, 25, 10]  # 1-char: 5%, 2-char: 25%, 3-char: 35%, 4-char: 25%, 5-char: 10%
-        symbol_length = random.choices(range(1, 6), weights=length_weights)[0]
-
-        # Generate symbol based on different strategies
-        strategy = random.choice(['industry', 'random', 'company_style', 'abbreviation'])
-
-        if strategy == 'industry':
-            # Use industry patterns
-            industry = random.choice(industry_patterns)
-            base = random.choice(industry)
-            if len(base) > symbol_length:
-                symbol = base[:symbol_length]
-            elif len(base) == symbol_length:
-                symbol = base
-            else:
-                # Add random letters to reach desired length
-                remaining = symbol_length - len(base)
-                symbol = base + ''.join(random.choices(string.ascii_uppercase, k=remaining))
-
-        elif strategy == 'company_style':
-            # Generate company-style abbreviations
-            if symbol_length <= 2:
-                # Use initials style
-                symbol = ''.join(random.choices(string.ascii_uppercase, k=symbol_length))
-            else:
-                # Use consonant-heavy patterns (more realistic)
-                consonants = 'BCDFGHJKLMNPQRSTVWXYZ'
-                vowels = 'AEIOU'
-
-                symbol = ''
-                for i in range(symbol_length):
-                    if i == 0 or (i > 0 and symbol[-1] in vowels):
-                        # Start with consonant or follow vowel with consonant
-                        symbol += random.choice(consonants)
-                    else:
-                        # Mix consonants and vowels
-                        symbol += random.choice(string.ascii_uppercase)
-
-        elif strategy == 'abbreviation':
-            # Create abbreviation-style symbols
-            if symbol_length >= 3:
-                # Common abbreviation patterns
-                patterns = ['ABC', 'XYZ', 'INC', 'CRP', 'GRP', 'SYS', 'TEC', 'DEV']
-                base = random.choice(patterns)[:symbol_length-1]
-                symbol = base + random.choice(string.ascii_uppercase)
-            else:
-                symbol = ''.join(random.choices(string.ascii_uppercase, k=symbol_length))
-
-        else:  # random
-            symbol = ''.join(random.choices(string.ascii_uppercase, k=symbol_length))
-
-        # Add to set (automatically handles uniqueness)
-        if symbol and len(symbol) <= 5:
-            symbols.add(symbol)
-
-        # Progress indicator
-        if attempts % 50000 == 0:
-            print(f"Generated {len(symbols)} unique symbols (attempt {attempts})...")
-
-    if len(symbols) < count:
-        print(f"WARNING: Could only generate {len(symbols)} unique symbols after {max_attempts} attempts")
-
-    # Convert to sorted list for consistent output
-    symbol_list = sorted(list(symbols))
-    return symbol_list[:count]
+    # All randomness is drawn in bulk inside the workers; the parent
+    # generator only spawns the per-round child streams
+    rng = np.random.default_rng(seed)
+    length_weights = np.array([0.05, 0.25, 0.35, 0.25, 0.10])  # 1-5 chars
+    consonants = 'BCDFGHJKLMNPQRSTVWXYZ'
+    vowels = 'AEIOU'
+    abbrev_patterns = ['ABC', 'XYZ', 'INC', 'CRP', 'GRP', 'SYS', 'TEC', 'DEV']
+    # Every industry group has the same size, so a uniform pick over the
+    # flattened list matches the old group-then-member two-step draw
+    industry_bases = [base for group in industry_patterns for base in group]
+    batch_size = 8192
+
+    # Pattern bases and letter rules pre-encoded as plain arrays so the
+    # jitted synthesis kernel never touches Python objects
+    cons_codes = np.array([ord(ch) - 64 for ch in consonants], dtype=np.int64)
+    is_vowel = np.zeros(27, dtype=np.bool_)
+    is_vowel[[ord(ch) - 64 for ch in vowels]] = True
+    industry_len = np.array([len(b) for b in industry_bases], dtype=np.int64)
+    industry_prefix = np.array([[_encode(b[:n]) for n in range(1, 6)]
+                                for b in industry_bases], dtype=np.int64)
+    abbrev_prefix = np.array([[_encode(p[:2]), _encode(p[:3])]
+                              for p in abbrev_patterns], dtype=np.int64)
+
+    # Method 2 works in the integer domain: every candidate is packed into
+    # a base-27 code and deduplicated against a bitmap indexed directly by
+    # code -- the whole 1-5 letter keyspace is only 27**5 bools (~14 MB),
+    # so membership is one load with no hashing or probing at all
+    seen_mask = np.zeros(27 ** 5, dtype=np.bool_)
+    accepted = np.empty(count, dtype=np.uint32)
+    n_accepted = _dedup_insert(seen_mask, accepted, 0,
+                               np.fromiter(seen, dtype=np.uint32, count=len(seen)))
+
+    tables = (length_weights, cons_codes, is_vowel, industry_len,
+              industry_prefix, abbrev_prefix)
+    n_workers = min(os.cpu_count() or 1, 8)
+
+    # Candidate synthesis is embarrassingly parallel: each round spawns
+    # independent child streams off the parent PCG64 generator (stream
+    # splitting) and farms one batch per worker. Dedup stays sequential
+    # in the parent, so the accepted order is deterministic
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        while n_accepted < count and attempts < max_attempts:
+            children = rng.spawn(n_workers)
+            for cand_codes in pool.map(_worker_candidates, children,
+                                       repeat(batch_size), repeat(tables)):
+                attempts += batch_size
+                n_accepted = _dedup_insert(seen_mask, accepted, n_accepted,
+                                           cand_codes)
+
+    if n_accepted < count:
+        print(f"WARNING: Could only generate {n_accepted} unique symbols after {max_attempts} attempts")
+
+    # Decode in deterministic acceptance order; the caller decides whether
+    # the final list gets sorted or shuffled
+    return [_decode(code) for code in accepted[:n_accepted]]
 
 def analyze_symbols(symbols):
     """Analyze the generated symbols"""
     print(f"\n=== SYMBOL ANALYSIS ===")
+    # generate_symbols guarantees uniqueness, no need to re-hash the list
     print(f"Total symbols: {len(symbols)}")
-    print(f"Unique symbols: {len(set(symbols))}")
 
-    # Length distribution
-    lengths = [len(s) for s in symbols]
-    length_counts = {}
-    for length in lengths:
-        length_counts[length] = length_counts.get(length, 0) + 1
+    # Length distribution (C-implemented Counter instead of dict.get loops)
+    length_counts = Counter(map(len, symbols))
 
     print(f"Length distribution:")
     for length in sorted(length_counts.keys()):
@@ -156,31 +261,24 @@ def analyze_symbols(symbols):
         percentage = (count / len(symbols)) * 100
         print(f"  {length} chars: {count:5d} symbols ({percentage:5.1f}%)")
 
-    # Character frequency
-    all_chars = ''.join(symbols)
-    char_freq = {}
-    for char in all_chars:
-        char_freq[char] = char_freq.get(char, 0) + 1
+    # Character frequency: one bincount over the raw bytes
+    buf = np.frombuffer(''.join(symbols).encode('ascii'), dtype=np.uint8)
+    char_counts = np.bincount(buf, minlength=128)
+    char_freq = {chr(c): int(n) for c, n in enumerate(char_counts) if n}
 
     print(f"\nMost common starting letters:")
-    first_chars = [s[0] for s in symbols]
-    first_char_freq = {}
-    for char in first_chars:
-        first_char_freq[char] = first_char_freq.get(char, 0) + 1
+    first_char_freq = Counter(s[0] for s in symbols)
 
-    sorted_first = sorted(first_char_freq.items(), key=lambda x: x[1], reverse=True)
-    for char, count in sorted_first[:10]:
+    sorted_first = first_char_freq.most_common(10)
+    for char, count in sorted_first:
         percentage = (count / len(symbols)) * 100
         print(f"  {char}: {count:4d} ({percentage:4.1f}%)")
 
     # Sample symbols by length
     print(f"\nSample symbols by length:")
-    by_length = {}
+    by_length = defaultdict(list)
     for s in symbols:
-        length = len(s)
-        if length not in by_length:
-            by_length[length] = []
-        by_length[length].append(s)
+        by_length[len(s)].append(s)
 
     for length in sorted(by_length.keys()):
         samples = by_length[length][:10]  # Show 10 samples per length
@@ -205,9 +303,13 @@ def main():
     # Generate symbols
     symbols = generate_symbols(count=args.count, seed=args.seed)
 
-    if not args.sort:
-        # Shuffle if not sorting
-        random.shuffle(symbols)
+    if args.sort:
+        symbols.sort()
+    else:
+        # Shuffle if not sorting: permute an index array and reorder with
+        # one fancy-index pass instead of 65k random.shuffle pointer swaps
+        rng = np.random.default_rng(args.seed)
+        symbols = [symbols[i] for i in rng.permutation(len(symbols))]
 
     if args.analyze:
         analyze_symbols(symbols)
@@ -215,8 +317,9 @@ def main():
     # Write to file
     try:
         with open(args.output, 'w', encoding='ascii') as f:
-            for symbol in symbols:
-                f.write(symbol + '\n')
+            # one joined write instead of 65k buffered f.write calls
+            f.write('\n'.join(symbols))
+            f.write('\n')
 
         print(f"\n{len(symbols)} symbols written to {args.output}")
 